@@ -1,10 +1,14 @@
 # ---------- IMPORTING THE NECESSARY LIBRARIES ----------
 
+import functools
+import json
 import os
 import re
+import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from playwright.sync_api import sync_playwright
 from reportlab.lib.pagesizes import A4
@@ -38,6 +42,32 @@ RB_WEIGHTS = {
 
 OPENAI_MODEL_DEFAULT = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
+# LLM budgets keyed by (model, net income), reused across runs
+LLM_CACHE_FILE = os.path.join(OUTPUT_DIR, ".llm_cache.json")
+_LLM_CACHE_LOCK = threading.Lock()
+_LLM_KEY_LOCKS: Dict[str, threading.Lock] = {}
+
+# Single background writer so debug dumps never block the error path;
+# created on first use and shut down before run() forks the PDF pool
+_DEBUG_WRITER: Optional[ThreadPoolExecutor] = None
+_DEBUG_WRITER_LOCK = threading.Lock()
+
+_OAI_CLIENT = None
+_OAI_CLIENT_LOCK = threading.Lock()
+
+# Precompiled patterns (label variants + currency variants, most specific first)
+_NET_PATTERNS = tuple(re.compile(p, re.I) for p in [
+    r"Net\s*Income\s*\(take\s*home\)[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
+    r"Net\s*Income[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
+    r"Net\s*Salary[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
+    r"Take\s*home[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
+    r"(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
+])
+_COOKIE_BUTTON_RE = re.compile(r"^(Accept|I Agree|Got it|OK)$", re.I)
+_STRIP_COMMAS = str.maketrans("", "", ",")
+_CURRENCY_RE = re.compile(r"GH[S₵¢]", re.I)
+_COERCE_FALLBACK = re.compile(r"(\d+(?:\.\d{1,2})?)")
+
 # ---------- UTILITIES ----------
 
 @dataclass
@@ -54,22 +84,19 @@ def _coerce_num(x) -> float:
     Robust numeric coercion for strings like '', '1,234.56', 'GH₵ 2,000'.
     Returns 0.0 if no number is found.
     """
-    s = str(x).replace(",", "").replace("GHS", "").replace("GH₵", "").replace("GH¢", "").strip()
+    s = _CURRENCY_RE.sub("", str(x).translate(_STRIP_COMMAS)).strip()
     if not s:
         return 0.0
     try:
         return float(s)
     except Exception:
-        m = re.search(r"(\d+(?:\.\d{1,2})?)", s)
+        m = _COERCE_FALLBACK.search(s)
         return float(m.group(1)) if m else 0.0
 
-def _dump_debug(page, scenario_name: str):
-    
+def _write_debug(path: str, txt: str, html: str):
     try:
         os.makedirs(OUTPUT_DIR, exist_ok=True)
-        txt = page.locator("body").inner_text(timeout=4000)
-        html = page.content()
-        with open(os.path.join(OUTPUT_DIR, f"debug_{scenario_name}.txt"), "w", encoding="utf-8") as f:
+        with open(path, "w", encoding="utf-8") as f:
             f.write("=== INNER TEXT ===\n")
             f.write(txt)
             f.write("\n\n=== HTML ===\n")
@@ -77,21 +104,51 @@ def _dump_debug(page, scenario_name: str):
     except Exception:
         pass
 
+def _dump_debug(page, scenario_name: str):
+    # Page reads must stay on the calling thread (Playwright objects are
+    # thread-bound); only the file write is handed to the background writer.
+    try:
+        txt = page.locator("body").inner_text(timeout=4000)
+        html = page.content()
+    except Exception:
+        return
+    path = os.path.join(OUTPUT_DIR, f"debug_{scenario_name}.txt")
+    global _DEBUG_WRITER
+    with _DEBUG_WRITER_LOCK:
+        if _DEBUG_WRITER is None:
+            _DEBUG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-writer")
+        _DEBUG_WRITER.submit(_write_debug, path, txt, html)
+
+def _flush_debug_writer():
+    # Finish pending dumps and stop the writer thread
+    global _DEBUG_WRITER
+    with _DEBUG_WRITER_LOCK:
+        if _DEBUG_WRITER is not None:
+            _DEBUG_WRITER.shutdown(wait=True)
+            _DEBUG_WRITER = None
+
 # ---------- WEB AUTOMATION ----------
 
+# Winning selector per field kind (TAX_CALC_URL is fixed), shared by all scenarios
+_FIELD_CACHE: Dict[str, str] = {}
+# One lock per field kind so probing one field never blocks another.
+# Re-entrant because _probe_field records its winner under the same lock.
+_FIELD_CACHE_LOCKS = {
+    kind: threading.RLock() for kind in ("salary", "allowances", "relief")
+}
+
 def _type_and_fire(page, sel: str, value: float) -> bool:
     loc = page.locator(sel).first
     if loc.count() == 0:
         return False
     loc.wait_for(state="visible", timeout=4000)
-    loc.fill("")            
-    loc.type(str(value))    
+    loc.fill(str(value))    # one CDP call; fires "input" natively
     try:
-        page.dispatch_event(sel, "input")
         page.dispatch_event(sel, "change")
         page.dispatch_event(sel, "blur")
     except Exception:
         pass
+    # Kept until the calculator is verified to recompute on fill()'s input event alone
     page.keyboard.press("Enter")
     page.wait_for_timeout(150)
     return True
@@ -125,59 +182,106 @@ def _set_field(page, kind: str, value: float):
             'label:has-text("Tax relief") >> .. >> input',
             'label:has-text("Tax Relief") >> .. >> input',
         ]
+    # Workers run concurrently, so the first one to reach an unresolved field
+    # probes the candidates while the others wait, then reuse its winner.
+    cached = _FIELD_CACHE.get(kind)
+    if cached is None:
+        with _FIELD_CACHE_LOCKS[kind]:
+            cached = _FIELD_CACHE.get(kind)
+            if cached is None:
+                _probe_field(page, kind, candidates, value)
+                return
+
+    try:
+        if _type_and_fire(page, cached, value):
+            return
+    except Exception:
+        pass
+    _probe_field(page, kind, [sel for sel in candidates if sel != cached], value)
+
+def _probe_field(page, kind: str, candidates: List[str], value: float):
     last_err = None
     for sel in candidates:
         try:
             if _type_and_fire(page, sel, value):
+                with _FIELD_CACHE_LOCKS[kind]:
+                    _FIELD_CACHE[kind] = sel
                 return
         except Exception as e:
             last_err = e
     raise RuntimeError(f"Could not set field '{kind}'. Last error: {last_err}")
 
 def _extract_amount_from_text(text: str) -> float:
-    # Try multiple label variants + currency variants
-    patterns = [
-        r"Net\s*Income\s*\(take\s*home\)[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
-        r"Net\s*Income[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
-        r"Net\s*Salary[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
-        r"Take\s*home[^\d]*(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
-        r"(?:GH\s*[SCc]|GH\s*[₵¢])?\s*([\d,]+(?:\.\d{1,2})?)",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text, re.I)
+    for pat in _NET_PATTERNS:
+        m = pat.search(text)
         if m and m.group(1).strip():
             return _coerce_num(m.group(1))
     return 0.0
 
+# In-page Net Income parser. Labels are tried in the same priority order as
+# _NET_PATTERNS and the first positive amount wins, so "Net Income" beats an
+# unrelated "take home ... 2024" that happens to appear earlier on the page.
+_PARSE_NET_INCOME_JS = r"""
+const parseNetIncome = () => {
+    const t = document.body ? document.body.innerText : "";
+    const patterns = [
+        /Net\s*Income\s*\(take\s*home\)[^\d]*([\d,]+(?:\.\d{1,2})?)/i,
+        /Net\s*Income[^\d]*([\d,]+(?:\.\d{1,2})?)/i,
+        /Net\s*Salary[^\d]*([\d,]+(?:\.\d{1,2})?)/i,
+        /Take\s*home[^\d]*([\d,]+(?:\.\d{1,2})?)/i,
+    ];
+    for (const re of patterns) {
+        const m = t.match(re);
+        const amt = m ? parseFloat(m[1].replace(/,/g, "")) : 0;
+        if (amt > 0) return amt;
+    }
+    return 0;
+};
+"""
+
+# Runs in the page so only the parsed number crosses the CDP wire
+_NET_INCOME_JS = "() => {" + _PARSE_NET_INCOME_JS + "return parseNetIncome(); }"
+
+# Flags window.__netReady on the first DOM mutation that leaves a Net Income
+# amount on the page (same ordered label matching as _NET_INCOME_JS),
+# instead of re-scanning the body text on every poll
+_WATCH_NET_INCOME_JS = "() => {" + _PARSE_NET_INCOME_JS + r"""
+    window.__netReady = false;
+    if (!document.body) return false;
+    new MutationObserver((_, obs) => {
+        if (parseNetIncome() > 0) {
+            window.__netReady = true;
+            obs.disconnect();
+        }
+    }).observe(document.body, {childList: true, subtree: true, characterData: true});
+    return true;
+}"""
+
 def _scrape_net_income(page) -> float:
     """
-    Aggressive extractor with retries:
-    - Prefer DOM containers near 'Net Income (take home)'
-    - Fallback to whole-page text
+    Extract Net Income in a single round-trip:
+    - Match the label and amount inside the page via page.evaluate
+    - Fallback to whole-page text only if evaluation fails
     """
-    # Strategy A: DOM scan near likely labels
-    labels = ["Net Income (take home)", "Net Income", "Net Salary", "Take home"]
-    for lab in labels:
-        try:
-            section = page.get_by_text(re.compile(re.escape(lab), re.I)).first
-            container = section.locator("xpath=ancestor-or-self::*[1]")
-            text = container.inner_text(timeout=1500)
-            amt = _extract_amount_from_text(text)
-            if amt > 0:
-                return amt
-        except Exception:
-            continue
+    try:
+        return float(page.evaluate(_NET_INCOME_JS) or 0.0)
+    except Exception:
+        pass
 
-    # Strategy B: whole page text
     try:
         text = page.locator("body").inner_text(timeout=4000)
     except Exception:
         text = page.content()
-    amt = _extract_amount_from_text(text)
-    return amt
+    return _extract_amount_from_text(text)
 
 def fill_tax_form_and_get_net_income(page, salary: float, allowances: float, relief: float, scenario_name: str) -> float:
-    # Assumes page is already on TAX_CALC_URL; navigation only once in run()
+    # Assumes page is already on TAX_CALC_URL; navigation happens in _open_calculator()
+    # Arm the readiness flag before filling so no result update is missed
+    try:
+        watching = bool(page.evaluate(_WATCH_NET_INCOME_JS))
+    except Exception:
+        watching = False
+
     # Fill
     _set_field(page, "salary", salary)
     _set_field(page, "allowances", allowances)
@@ -189,18 +293,13 @@ def fill_tax_form_and_get_net_income(page, salary: float, allowances: float, rel
     except Exception:
         pass
 
-    # Wait until label & money-like number appear; then scrape
+    # Wait until the observer has seen the label & amount update; then scrape.
+    # Without an observer the flag never flips, so poll for the amount instead.
     try:
-        page.wait_for_load_state("networkidle")
-        page.wait_for_function(
-            """() => {
-                const t = (document.body.innerText || "").replace(/\\s+/g, " ");
-                const hasLabel = /Net\\s*Income|Net\\s*Salary|Take\\s*home/i.test(t);
-                const hasMoneyLike = /(GH\\s*[SCc]|GH\\s*[₵¢])?\\s*\\d{1,3}(?:,\\d{3})*(?:\\.\\d{1,2})?/.test(t);
-                return hasLabel && hasMoneyLike;
-            }""",
-            timeout=20000
-        )
+        if watching:
+            page.wait_for_function("() => window.__netReady === true", timeout=20000)
+        else:
+            page.wait_for_function(_NET_INCOME_JS, timeout=20000)
     except Exception:
         # continue; we'll try scraping anyway
         pass
@@ -218,14 +317,70 @@ def fill_tax_form_and_get_net_income(page, salary: float, allowances: float, rel
 
 # ---------- BUDGET GENERATION ----------
 
+def _load_llm_cache() -> Dict:
+    try:
+        with open(LLM_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _store_llm_cache(key: str, items: Dict[str, float], note: str):
+    with _LLM_CACHE_LOCK:
+        cache = _load_llm_cache()
+        cache[key] = {"items": items, "note": note}
+        # Write atomically so concurrent runs never read a truncated file
+        tmp = f"{LLM_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp, LLM_CACHE_FILE)
+        except Exception:
+            pass
+
 def generate_budget_with_llm(net_income: float) -> Tuple[Dict[str, float], str]:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("No OPENAI_API_KEY in environment.")
 
+    # Quantize so equal take-home amounts share one LLM call
+    model = os.getenv("OPENAI_MODEL", OPENAI_MODEL_DEFAULT)
+    net_income = round(net_income, 2)
+
+    # Budgets are requested from several threads at once; serialize per key
+    # so a concurrent caller waits for the in-flight result instead of
+    # issuing a duplicate request.
+    with _LLM_CACHE_LOCK:
+        key_lock = _LLM_KEY_LOCKS.setdefault(f"{model}:{net_income:.2f}", threading.Lock())
+    with key_lock:
+        items, note = _cached_budget_with_llm(net_income, model)
+    return dict(items), note
+
+@functools.lru_cache(maxsize=64)
+def _cached_budget_with_llm(net_income: float, model: str) -> Tuple[Dict[str, float], str]:
+    # In-process LRU in front of the on-disk cache (reused across runs)
+    key = f"{model}:{net_income:.2f}"
+    with _LLM_CACHE_LOCK:
+        hit = _load_llm_cache().get(key)
+    if hit:
+        return hit["items"], hit["note"]
+
+    items, note = _call_llm_budget(net_income, model)
+    _store_llm_cache(key, items, note)
+    return items, note
+
+def _get_client():
+    # One client for the whole process keeps its HTTP connection pool warm
+    global _OAI_CLIENT
+    with _OAI_CLIENT_LOCK:
+        if _OAI_CLIENT is None:
+            from openai import OpenAI
+            _OAI_CLIENT = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+        return _OAI_CLIENT
+
+def _call_llm_budget(net_income: float, model: str) -> Tuple[Dict[str, float], str]:
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
+        client = _get_client()
 
         prompt = f"""
 Create a Ghana-appropriate monthly budget for a net income of GHS {net_income:,.2f}.
@@ -237,31 +392,16 @@ Do not any extra text.
 """.strip()
 
         resp = client.chat.completions.create(
-            model=os.getenv("OPENAI_MODEL", OPENAI_MODEL_DEFAULT),
+            model=model,
             messages=[
-                {"role": "system", "content": "You are a helpful financial planning assistant."},
+                {"role": "system", "content": "You are a helpful financial planning assistant. Always reply with a single JSON object."},
                 {"role": "user", "content": prompt},
             ],
+            response_format={"type": "json_object"},
             temperature=0.3,
         )
-        content = resp.choices[0].message.content.strip()
-
-        # Tolerate fenced JSON
-        c = content.strip()
-        if c.startswith("```"):
-            c = c.strip("`")
-            jm = re.search(r"\{.*\}", c, re.S)
-            if jm:
-                c = jm.group(0)
-
-        import json
-        try:
-            data = json.loads(c)
-        except Exception:
-            jm = re.search(r"\{.*\}", c, re.S)
-            if not jm:
-                raise RuntimeError("LLM did not return valid JSON.")
-            data = json.loads(jm.group(0))
+        # JSON mode guarantees a parseable object
+        data = json.loads(resp.choices[0].message.content)
 
         items = data.get("items", {})
         note = data.get("note", "").strip()
@@ -283,8 +423,13 @@ Do not any extra text.
         raise RuntimeError(f"LLM call failed: {e}")
 
 def generate_budget_rule_based(net_income: float) -> Tuple[Dict[str, float], str]:
-    items = {cat: round(net_income * w, 2) for cat, w in RB_WEIGHTS.items()}
-    total = sum(items.values())
+    # Allocate and total in a single pass over the weights
+    items: Dict[str, float] = {}
+    total = 0.0
+    for cat, w in RB_WEIGHTS.items():
+        amt = round(net_income * w, 2)
+        items[cat] = amt
+        total += amt
     # If rounding pushed us over, trim Discretionary
     if total > net_income and "Discretionary" in items:
         excess = round(total - net_income, 2)
@@ -308,23 +453,37 @@ def produce_budget(net_income: float) -> Tuple[List[BudgetItem], str]:
 
 # ---------- PDF GENERATION PROCESS ----------
 
+# Built once; identical for every scenario's report
+_STYLES = getSampleStyleSheet()
+_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#f0f0f0")),
+    ("TEXTCOLOR", (0,0), (-1,0), colors.black),
+    ("ALIGN", (1,1), (-1,-2), "RIGHT"),
+    ("ALIGN", (2,1), (-1,-2), "RIGHT"),
+    ("FONTNAME", (0,0), (-1,0), "Helvetica-Bold"),
+    ("GRID", (0,0), (-1,-1), 0.5, colors.grey),
+    ("BACKGROUND", (0,-1), (-1,-1), colors.HexColor("#f7f7f7")),
+    ("FONTNAME", (0,-1), (-1,-1), "Helvetica-Bold"),
+])
+
 def save_budget_pdf(filename: str, scenario: Dict, net_income: float, items: List[BudgetItem], note: str):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     path = os.path.join(OUTPUT_DIR, filename)
 
+    # Format rows and accumulate totals in one pass over items
     data = [["Category", "Amount (GHS)", "% of Net Income"]]
+    total_amt = 0.0
+    total_pct = 0.0
     for bi in items:
+        total_amt += bi.amount
+        total_pct += bi.pct
         data.append([bi.category, f"{bi.amount:,.2f}", f"{bi.pct*100:.1f}%"])
-
-    total_amt = sum(b.amount for b in items)
-    total_pct = sum(b.pct for b in items) * 100
-    data.append(["Total", f"{total_amt:,.2f}", f"{total_pct:.1f}%"])
+    data.append(["Total", f"{total_amt:,.2f}", f"{total_pct*100:.1f}%"])
 
     doc = SimpleDocTemplate(path, pagesize=A4, rightMargin=24, leftMargin=24, topMargin=24, bottomMargin=24)
-    styles = getSampleStyleSheet()
     story = []
 
-    title = Paragraph(f"<b>Monthly Budget Report — {scenario['name'].capitalize()}</b>", styles["Title"])
+    title = Paragraph(f"<b>Monthly Budget Report — {scenario['name'].capitalize()}</b>", _STYLES["Title"])
     story.append(title)
     story.append(Spacer(1, 8))
 
@@ -333,55 +492,52 @@ def save_budget_pdf(filename: str, scenario: Dict, net_income: float, items: Lis
         f"Allowances = <b>{ghc(scenario['allowances'])}</b>, "
         f"Tax relief = <b>{ghc(scenario['relief'])}</b><br/>"
         f"Net Income (take home): <b>{ghc(net_income)}</b>",
-        styles["BodyText"]
+        _STYLES["BodyText"]
     )
     story.append(meta)
     story.append(Spacer(1, 10))
 
     table = Table(data, colWidths=[None, 90, 120])
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#f0f0f0")),
-        ("TEXTCOLOR", (0,0), (-1,0), colors.black),
-        ("ALIGN", (1,1), (-1,-2), "RIGHT"),
-        ("ALIGN", (2,1), (-1,-2), "RIGHT"),
-        ("FONTNAME", (0,0), (-1,0), "Helvetica-Bold"),
-        ("GRID", (0,0), (-1,-1), 0.5, colors.grey),
-        ("BACKGROUND", (0,-1), (-1,-1), colors.HexColor("#f7f7f7")),
-        ("FONTNAME", (0,-1), (-1,-1), "Helvetica-Bold"),
-    ]))
+    table.setStyle(_TABLE_STYLE)
     story.append(table)
     story.append(Spacer(1, 10))
 
-    note_para = Paragraph(f"<i>Notes:</i> {note}", styles["BodyText"])
+    note_para = Paragraph(f"<i>Notes:</i> {note}", _STYLES["BodyText"])
     story.append(note_para)
 
     doc.build(story)
     return path
 
 # ---------- ORCHESTRATION ----------
-def run():
-    headless = os.getenv("HEADFUL") != "1"
-    results: List[Tuple[Dict, float]] = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
 
-        # Navigate once (optimization)
-        page.goto(TAX_CALC_URL, wait_until="domcontentloaded", timeout=60_000)
-        page.wait_for_timeout(600)
+def _open_calculator(page):
+    page.goto(TAX_CALC_URL, wait_until="domcontentloaded", timeout=60_000)
+    page.wait_for_timeout(600)
 
-        # Dismiss possible cookie banners (best-effort)
-        for text in ["Accept", "I Agree", "Got it", "OK"]:
-            try:
-                page.get_by_role("button", name=re.compile(text, re.I)).first.click(timeout=1000)
-                page.wait_for_timeout(150)
-            except Exception:
-                pass
+    # Dismiss possible cookie banners (best-effort, one query for all labels)
+    try:
+        page.get_by_role("button", name=_COOKIE_BUTTON_RE).first.click(timeout=300)
+        page.wait_for_timeout(150)
+    except Exception:
+        pass
 
-        for sc in SCENARIOS:
+def _scrape_scenario(sc: Dict, headless: bool, cdp_url: Optional[str] = None) -> Tuple[Dict, float]:
+    # Sync Playwright objects are bound to the thread that created them,
+    # so every worker drives its own Playwright instance and context.
+    # With a CDP endpoint the workers attach to one shared Chromium
+    # (see browser_server.py) instead of each launching their own.
+    page = None
+    # Any failure, including browser/context setup, only zeroes this scenario
+    try:
+        with sync_playwright() as p:
+            if cdp_url:
+                browser = p.chromium.connect_over_cdp(cdp_url)
+            else:
+                browser = p.chromium.launch(headless=headless)
             try:
+                context = browser.new_context()
+                page = context.new_page()
+                _open_calculator(page)
                 net_income = fill_tax_form_and_get_net_income(
                     page,
                     salary=sc["salary"],
@@ -389,23 +545,51 @@ def run():
                     relief=sc["relief"],
                     scenario_name=sc["name"],
                 )
-                results.append((sc, net_income))
-                print(f"[OK] {sc['name']}: Net Income = {ghc(net_income)}")
-            except Exception as e:
-                print(f"[ERROR] {sc['name']}: {e}")
-                _dump_debug(page, f"error_{sc['name']}_{int(time.time())}")
-                results.append((sc, 0.0))
-
-        context.close()
-        browser.close()
-
-    # PDFs
-    for sc, net in results:
-        items, note = produce_budget(net)
-        fname = f"budget_{sc['name']}.pdf"
-        out = save_budget_pdf(fname, sc, net, items, note)
-        print(f"[PDF] Wrote {out}")
+            except Exception:
+                if page is not None:
+                    _dump_debug(page, f"error_{sc['name']}_{int(time.time())}")
+                raise
+            finally:
+                # Closes our contexts; a CDP-shared browser is only disconnected
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+        print(f"[OK] {sc['name']}: Net Income = {ghc(net_income)}")
+        return sc, net_income
+    except Exception as e:
+        print(f"[ERROR] {sc['name']}: {e}")
+        return sc, 0.0
+
+def _render_one(job: Tuple[Dict, float, List[BudgetItem], str]) -> str:
+    sc, net, items, note = job
+    return save_budget_pdf(f"budget_{sc['name']}.pdf", sc, net, items, note)
+
+def run(cdp_url: Optional[str] = None):
+    headless = os.getenv("HEADFUL") != "1"
+
+    # Budgets are requested as soon as a scenario's net income is known,
+    # so LLM calls overlap with the scenarios still being scraped.
+    with ThreadPoolExecutor(max_workers=len(SCENARIOS)) as budget_pool:
+        def scrape_and_budget(sc: Dict) -> Tuple[Dict, float, Future]:
+            sc, net_income = _scrape_scenario(sc, headless, cdp_url)
+            return sc, net_income, budget_pool.submit(produce_budget, net_income)
+
+        # Scenarios are independent and mostly wait on the remote page,
+        # so run them concurrently; map() keeps results in SCENARIOS order.
+        with ThreadPoolExecutor(max_workers=len(SCENARIOS)) as scrape_pool:
+            results = list(scrape_pool.map(scrape_and_budget, SCENARIOS))
+
+        budgets = [(sc, net, *budget.result()) for sc, net, budget in results]
+
+    # No threads may be alive when the PDF pool forks
+    _flush_debug_writer()
+
+    # PDFs: ReportLab layout is CPU-bound and independent per scenario
+    with ProcessPoolExecutor(max_workers=min(len(budgets), os.cpu_count() or 1)) as pdf_pool:
+        for out in pdf_pool.map(_render_one, budgets):
+            print(f"[PDF] Wrote {out}")
 
 if __name__ == "__main__":
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    run()
+    run(cdp_url=os.getenv("CDP_URL"))
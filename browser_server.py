@@ -0,0 +1,84 @@
+# ---------- SHARED BROWSER SIDECAR ----------
+#
+# Launches one headless Chromium with remote debugging enabled and writes its
+# CDP WebSocket URL to outputs/cdp_url.txt, so repeated agent runs can attach
+# to it instead of paying the browser cold-start each time:
+#
+#   python browser_server.py &
+#   until [ -s outputs/cdp_url.txt ]; do sleep 0.2; done
+#   CDP_URL=$(cat outputs/cdp_url.txt) python agent.py
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+from playwright.sync_api import sync_playwright
+
+from agent import OUTPUT_DIR
+
+CDP_PORT = int(os.getenv("CDP_PORT", "9222"))
+CDP_URL_FILE = os.path.join(OUTPUT_DIR, "cdp_url.txt")
+CHROMIUM_LOG_FILE = os.path.join(OUTPUT_DIR, "chromium.log")
+
+def _chromium_path() -> str:
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+def serve():
+    # `kill` (SIGTERM) should clean up like Ctrl+C does
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    log = open(CHROMIUM_LOG_FILE, "w", encoding="utf-8")
+    proc = subprocess.Popen(
+        [
+            _chromium_path(),
+            f"--remote-debugging-port={CDP_PORT}",
+            "--headless=new",
+            "--no-sandbox",  # same default as Playwright's launch()
+            "--no-first-run",
+            "--no-default-browser-check",
+            "about:blank",
+        ],
+        stdout=log,
+        stderr=log,
+    )
+
+    try:
+        # Poll the DevTools HTTP endpoint until Chromium is ready
+        ws_url = None
+        deadline = time.time() + 15
+        while time.time() < deadline and proc.poll() is None:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{CDP_PORT}/json/version", timeout=1) as resp:
+                    ws_url = json.load(resp)["webSocketDebuggerUrl"]
+                    break
+            except Exception:
+                time.sleep(0.2)
+        if not ws_url:
+            raise RuntimeError(f"Chromium did not expose a CDP endpoint. See {CHROMIUM_LOG_FILE}.")
+
+        # Write atomically so readers never see a partial URL
+        tmp = CDP_URL_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(ws_url)
+        os.replace(tmp, CDP_URL_FILE)
+        print(f"[CDP] {ws_url} (written to {CDP_URL_FILE})", flush=True)
+
+        proc.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+        log.close()
+        if os.path.exists(CDP_URL_FILE):
+            os.remove(CDP_URL_FILE)
+
+if __name__ == "__main__":
+    serve()